@@ -1,63 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
 
-np.random.seed(42)
+rng = np.random.default_rng(42)
 markets = ["Power_FR", "Power_DE", "Gas_TTF"]
 maturities = np.arange(1, 13)  # échéances M+1..M+12
+dtype = np.float32  # précision de stockage de la simulation (float32 : moitié moins d'octets déplacés)
 
 # Dates : 252 jours ouvrés à partir du 01/01/2024
 dates = pd.bdate_range("2024-01-01", periods=252*2, tz='UTC')
 
 # Courbes forward initiales (valeurs de base par marché, ici choix arbitraire)
 F0 = {
-    "Power_FR": np.array([50.0 + 0.5*(m-1) for m in maturities]),
-    "Power_DE": np.array([52.0 + 0.4*(m-1) for m in maturities]),
-    "Gas_TTF":  np.array([ 3.0 + 0.1*(m-1) for m in maturities])
+    "Power_FR": 50.0 + 0.5*(maturities-1),
+    "Power_DE": 52.0 + 0.4*(maturities-1),
+    "Gas_TTF":   3.0 + 0.1*(maturities-1)
 }
 
 # Expositions aux facteurs : décroissance exponentielle en T, 3 facteurs (global, électricité, gaz)
+# Layout (n_markets, n_factors, n_maturities) : exposures[i_mkt, j] est contigu en mémoire
 alphas = [0.05, 0.20, 0.15]  # paramètres de décroissance
-exposures = np.zeros((len(markets), len(maturities), 3))
-for i, m in enumerate(maturities):
-    expos = np.exp(-alphas[0]*m)   # facteur global
-    exposures[0,i,0] = expos  # Power_FR
-    exposures[1,i,0] = expos  # Power_DE
-    exposures[2,i,0] = expos  # Gas_TTF
-    expos_elec = np.exp(-alphas[1]*m)
-    exposures[0,i,1] = expos_elec  # facteur électricité sur FR
-    exposures[1,i,1] = expos_elec  # sur DE
-    expos_gaz = np.exp(-alphas[2]*m)
-    exposures[2,i,2] = expos_gaz   # facteur gaz sur Gas_TTF
+exposures = np.zeros((len(markets), 3, len(maturities)), dtype=dtype)
+exposures[:, 0] = np.exp(-alphas[0]*maturities)       # facteur global sur tous les marchés
+exposures[0:2, 1] = np.exp(-alphas[1]*maturities)     # facteur électricité sur FR et DE
+exposures[2, 2] = np.exp(-alphas[2]*maturities)       # facteur gaz sur Gas_TTF
+exposures = np.ascontiguousarray(exposures)
 
 # Volatilités des facteurs et bruit idiosyncratique
-factor_vol = np.array([0.03, 0.03, 0.04])  # volat. journalières des 3 facteurs
+factor_vol = np.array([0.03, 0.03, 0.04], dtype=dtype)  # volat. journalières des 3 facteurs
 idiosyn_vol = 0.005
 
-# DataFrames pour stocker les courbes simulées
-forward_prices = {mkt: pd.DataFrame(index=dates, columns=maturities) for mkt in markets}
-for mkt in markets:
-    forward_prices[mkt] = forward_prices[mkt].astype(float)
-    forward_prices[mkt].iloc[0] = F0[mkt]  # courbe initiale au jour 0
-
-# Simulation journalière
-for t in range(1, len(dates)):
-    # tirer les facteurs du jour t
-    factors = np.random.normal(0, 1, 3) * factor_vol
-    eps = np.random.normal(0, idiosyn_vol, (len(markets), len(maturities)))
-    for i_mkt, mkt in enumerate(markets):
-        prev = forward_prices[mkt].iloc[t-1].values.astype(float)
-        delta_log = np.zeros(len(maturities))
-        for j in range(3):
-            delta_log += factors[j] * exposures[i_mkt,:,j]
-        delta_log += eps[i_mkt]
-        forward_prices[mkt].iloc[t] = prev * np.exp(delta_log)
-        
+# Budget mémoire des buffers de travail de la simulation (taille typique d'un cache L2)
+L2_BYTES = 256 * 1024
+
+
+def simulate_market(log_F0, factors, eps, exposures, block_size=None, dtype=np.float32, out=None):
+    """
+    Accumulate daily log-price increments into the simulated log forward curves of one market.
+
+    Time is processed in blocks of block_size days. By default the block size is
+    derived from L2_BYTES so that the scratch buffers (increments in dtype plus
+    the float64 cumulative sum) stay within that budget, whatever the horizon
+    and the number of maturities.
+    Increments and outputs are stored in dtype; the cumulative sum itself is
+    always carried out in float64 to avoid drift over long horizons.
+
+    :param np.ndarray log_F0: Initial log forward curve, shape (n_maturities,).
+    :param np.ndarray factors: Factor shocks shared by all markets, shape (n_steps, n_factors).
+    :param np.ndarray eps: Idiosyncratic shocks of the market, shape (n_steps, n_maturities).
+    :param np.ndarray exposures: Factor exposures of the market, shape (n_factors, n_maturities).
+    :param int block_size: Number of days processed per block (None: derived from L2_BYTES).
+    :param np.dtype dtype: Storage precision of the increments and of the result.
+    :param np.ndarray out: Optional output buffer, shape (n_steps + 1, n_maturities).
+    :returns: Simulated log-prices, shape (n_steps + 1, n_maturities).
+    :rtype: np.ndarray
+    """
+    n_steps = factors.shape[0]
+    n_maturities = log_F0.shape[0]
+    if out is None:
+        out = np.empty((n_steps + 1, n_maturities), dtype=dtype)
+    out[0] = log_F0
+    if block_size is None:
+        # Un jour occupe n_maturities valeurs en dtype (incréments) + en float64 (somme cumulée)
+        block_size = max(1, L2_BYTES // (n_maturities * (np.dtype(dtype).itemsize + 8)))
+    block_size = min(block_size, max(n_steps, 1))
+    block_buf = np.empty((block_size, n_maturities), dtype=dtype)
+    acc_buf = np.empty((block_size, n_maturities), dtype=np.float64)
+    carry = np.array(log_F0, dtype=np.float64)  # dernière courbe du bloc précédent
+    for start in range(0, n_steps, block_size):
+        stop = min(start + block_size, n_steps)
+        buf = block_buf[:stop - start]
+        acc = acc_buf[:stop - start]
+        # Incréments du bloc : contribution des facteurs + bruit idiosyncratique
+        np.matmul(factors[start:stop], exposures, out=buf)
+        buf += eps[start:stop]
+        # Somme cumulée en float64, décalée par la dernière courbe du bloc précédent
+        np.cumsum(buf, axis=0, dtype=np.float64, out=acc)
+        acc += carry
+        out[start + 1:stop + 1] = acc
+        carry[:] = acc[-1]
+    return out
+
+
+def simulate_log_prices(log_F0, factors, eps, exposures, block_size=None, dtype=np.float32, n_jobs=None):
+    """
+    Simulate the log forward curves of all markets.
+
+    Markets only share the factor shocks, so each one is simulated
+    independently in a thread pool (NumPy releases the GIL in its kernels).
+
+    :param np.ndarray log_F0: Initial log forward curves, shape (n_markets, n_maturities).
+    :param np.ndarray factors: Factor shocks, shape (n_steps, n_factors).
+    :param np.ndarray eps: Idiosyncratic shocks, shape (n_steps, n_markets, n_maturities).
+    :param np.ndarray exposures: Factor exposures, shape (n_markets, n_factors, n_maturities).
+    :param int block_size: Number of days processed per block (None: derived from L2_BYTES).
+    :param np.dtype dtype: Storage precision of the increments and of the result.
+    :param int n_jobs: Maximum number of worker threads (None lets the executor choose).
+    :returns: Simulated log-prices, shape (n_markets, n_steps + 1, n_maturities).
+    :rtype: np.ndarray
+    """
+    n_markets, n_maturities = log_F0.shape
+    n_steps = factors.shape[0]
+    log_prices = np.empty((n_markets, n_steps + 1, n_maturities), dtype=dtype)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        futures = [
+            executor.submit(simulate_market, log_F0[i], factors, eps[:, i], exposures[i],
+                            block_size, dtype, log_prices[i])
+            for i in range(n_markets)
+        ]
+        for future in futures:
+            future.result()
+    return log_prices
+
+
+n_markets, n_days, n_maturities = len(markets), len(dates), len(maturities)
+
+# Tirages de tous les facteurs et bruits en une fois (jours 1..n_days-1)
+factors = rng.standard_normal((n_days-1, 3), dtype=dtype) * factor_vol
+eps = rng.standard_normal((n_days-1, n_markets, n_maturities), dtype=dtype)
+eps *= dtype(idiosyn_vol)
+
+# Log-prix simulés, shape (n_markets, n_days, n_maturities)
+log_F0 = np.log(np.stack([F0[mkt] for mkt in markets]))  # courbe initiale au jour 0
+log_prices = simulate_log_prices(log_F0, factors, eps, exposures, dtype=dtype)
+
+# Prix simulés : stockage NumPy, shape (n_markets, n_days, n_maturities)
+prices_arr = np.exp(log_prices, out=log_prices)
+
+# DataFrames des courbes simulées, construits une seule fois à partir de prices_arr
+forward_prices = {
+    mkt: pd.DataFrame(prices_arr[i], index=dates, columns=maturities)
+    for i, mkt in enumerate(markets)
+}
 
 import matplotlib.pyplot as plt
 
 plt.figure(figsize=(14, 6))
-for mkt in markets:
-    plt.plot(forward_prices[mkt].index, forward_prices[mkt][1], label=f"{mkt} (M+1)", marker='x')
+for i_mkt, mkt in enumerate(markets):
+    # Tracé direct depuis le ndarray : colonne 0 = échéance M+1
+    plt.plot(dates, prices_arr[i_mkt, :, 0], label=f"{mkt} (M+1)", marker='x')
 plt.title("Time Series des prix forward (échéance M+1)")
 plt.xlabel("Date")
 plt.ylabel("Prix Forward")
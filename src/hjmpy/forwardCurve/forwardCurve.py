@@ -1,6 +1,7 @@
+from functools import cached_property
+
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
 
 class ForwardCurve:
     """
@@ -18,9 +19,11 @@ class ForwardCurve:
         """
         self.dates = np.array(dates)
         self.prices = np.array(prices)
-        # Build an interpolator for the forward price at any time T (log-linear interpolation)
-        self._interp = interp1d(self.dates, np.log(self.prices),
-                                kind='linear', fill_value="extrapolate")
+        # Precompute the arrays used for log-linear interpolation of the forward price at any time T
+        self._log_prices = np.log(self.prices, dtype=np.float64)  # computed once, shared with log_returns
+        order = np.argsort(self.dates, kind='stable')
+        self._dates_sorted = self.dates[order]
+        self._log_prices_sorted = self._log_prices[order]
 
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame, date_col: str, price_col: str):
@@ -33,8 +36,12 @@ class ForwardCurve:
         :returns: ForwardCurve instance.
         :rtype: ForwardCurve
         """
-        dates = pd.to_datetime(df[date_col]).astype(np.int64) / (1e9 * 86400)  # convert to days or years
-        prices = df[price_col].values
+        date_series = df[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(date_series):
+            date_series = pd.to_datetime(date_series)
+        dates_ns = date_series.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        dates = dates_ns * (1.0 / (1e9 * 86400.0))  # convert to days or years
+        prices = df[price_col].to_numpy(copy=False)
         return cls(dates, prices)
 
     def get_forward(self, T: float) -> float:
@@ -45,19 +52,82 @@ class ForwardCurve:
         :returns: Forward price at time T.
         :rtype: float
         """
-        logp = self._interp(T)
-        return np.exp(logp)
+        return np.exp(self._interp_log(T))
+
+    def get_forwards(self, Ts: np.ndarray) -> np.ndarray:
+        """
+        Get the forward prices for several maturities in a single vectorized call.
+
+        :param np.ndarray Ts: Array of maturity times.
+        :returns: Array of forward prices, same shape as Ts.
+        :rtype: np.ndarray
+        """
+        return np.exp(self._interp_log(np.asarray(Ts, dtype=np.float64)))
+
+    def _interp_log(self, T):
+        """
+        Linearly interpolate (or extrapolate) the log-price at maturity T.
+
+        :param T: Maturity time or array of maturity times.
+        :returns: Interpolated log-price(s).
+        """
+        x, y = self._dates_sorted, self._log_prices_sorted
+        logp = np.interp(T, x, y)
+        if np.ndim(T) == 0:
+            if T < x[0]:
+                logp = y[0] + self._edge_slope(0, 1) * (T - x[0])
+            elif T > x[-1]:
+                logp = y[-1] + self._edge_slope(-2, -1) * (T - x[-1])
+            return logp
+        T = np.asarray(T, dtype=np.float64)
+        left, right = T < x[0], T > x[-1]
+        if left.any():
+            logp = np.where(left, y[0] + self._edge_slope(0, 1) * (T - x[0]), logp)
+        if right.any():
+            logp = np.where(right, y[-1] + self._edge_slope(-2, -1) * (T - x[-1]), logp)
+        return logp
+
+    def _edge_slope(self, i: int, j: int) -> float:
+        """
+        Slope of the log-price between sorted points i and j, used for linear extrapolation.
+
+        Only evaluated when a maturity actually falls outside the curve, so that
+        duplicated end dates do not affect ordinary interpolation.
+
+        :param int i: Index of the first point.
+        :param int j: Index of the second point.
+        :returns: Slope of the segment (0.0 for a single-point curve).
+        :rtype: float
+        """
+        x, y = self._dates_sorted, self._log_prices_sorted
+        if len(x) < 2:
+            return 0.0
+        return (y[j] - y[i]) / (x[j] - x[i])
 
     def log_returns(self) -> np.ndarray:
         """
         Compute log returns from stored prices.
 
-        Useful for calibration methods such as PCA.
+        Useful for calibration methods such as PCA. The array is computed once
+        and shared between calls, so it is returned read-only; copy it before
+        modifying it in place.
+
+        :returns: Read-only array of log returns.
+        :rtype: np.ndarray
+        """
+        return self._log_returns
+
+    @cached_property
+    def _log_returns(self) -> np.ndarray:
+        """
+        Log returns computed once from the cached log-prices (read-only).
 
-        :returns: Array of log returns.
+        :returns: Read-only array of log returns.
         :rtype: np.ndarray
         """
-        return np.diff(np.log(self.prices))
+        returns = np.diff(self._log_prices)
+        returns.flags.writeable = False
+        return returns
 
     def slice(self, start: float, end: float):
         """
@@ -1,6 +1,7 @@
 from hjmpy.volatilityModel.volatilityModel import VolatilityModel
 from hjmpy.market.market import Market
 
+import math
 import numpy as np
 
 class HJMModel:
@@ -46,7 +47,10 @@ class HJMModel:
                     returns.append(r)
         # Aligner les longueurs : on coupe au plus petit vecteur de rendements
         min_len = min(len(r) for r in returns)
-        mat = np.column_stack([r[-min_len:] for r in returns])  # shape (min_len, n_products)
+        # Matrice C-contigu\u00eb pr\u00e9allou\u00e9e, shape (min_len, n_products)
+        mat = np.empty((min_len, len(returns)), dtype=np.float64, order='C')
+        for j, r in enumerate(returns):
+            mat[:, j] = r[-min_len:]
         # PCA
         self.vol_model.calibrate(mat)
         print(f"Explained variance (top {self.vol_model.n_factors} factors): ",
@@ -73,19 +77,43 @@ class HJMModel:
         curve = market.get_curve(curve_name)
         T = curve.dates[-1]  # maturit\u00e9 ultime de la courbe (ex: fin de livraison)
         # Exemple simplifi\u00e9 : on utilise un seul facteur constant pour d\u00e9mo
-        sigma = self.vol_model.sigma(t0, T)
-        if isinstance(sigma, np.ndarray):
-            # Multi-facteurs : on somme les variances
-            var = np.sum(sigma**2) * (t1 - t0)
-        else:
-            var = sigma**2 * (t1 - t0)
+        # Variance totale (somm\u00e9e sur les facteurs en multi-facteurs)
+        var = self.vol_model.variance(t0, T) * (t1 - t0)
         F0 = curve.get_forward(T)
         # On ne simule pas W (monte-carlo interdite) : on donne le log-normale sans tirage
         drift = -0.5 * var
         # Valeur attendue : exp(drift), variance log-normal Var
-        F1_expected = F0 * np.exp(drift)
+        if np.ndim(drift) == 0:
+            # Chemin scalaire : math.exp \u00e9vite le co\u00fbt de dispatch des ufuncs NumPy
+            F1_expected = F0 * math.exp(drift)
+        else:
+            F1_expected = F0 * np.exp(drift)
         return F1_expected
 
+    def forward_dynamics_batch(self, market_name: str, curve_name: str,
+                               t0: np.ndarray, t1: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of forward_dynamics over arrays of (t0, t1) pairs.
+
+        The market and curve are looked up only once, and the expected forward
+        prices are computed in a single broadcasted expression.
+
+        :param str market_name: Name of the market containing the forward curve.
+        :param str curve_name: Name of the forward curve within the market.
+        :param np.ndarray t0: Initial times.
+        :param np.ndarray t1: Future times at which to evaluate the forward price (broadcast against t0).
+
+        :returns: Expected forward prices at times t1.
+        :rtype: np.ndarray
+        """
+        curve = self.markets[market_name].get_curve(curve_name)
+        T = curve.dates[-1]
+        t0 = np.asarray(t0, dtype=np.float64)
+        t1 = np.asarray(t1, dtype=np.float64)
+        sigma_sq = self.vol_model.variance(t0, T)
+        F0 = curve.get_forward(T)
+        return F0 * np.exp(-0.5 * sigma_sq * (t1 - t0))
+
     def price_forward(self, market_name: str, curve_name: str, t: float):
         """
         Return the forward price at time t for the final delivery of the curve.
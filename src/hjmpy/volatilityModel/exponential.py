@@ -1,5 +1,6 @@
 from hjmpy.volatilityModel.volatilityModel import VolatilityModel
 
+import math
 import numpy as np
 
 
@@ -20,17 +21,36 @@ class ExponentialVolatilityModel(VolatilityModel):
         self.gamma = gamma
         self.k = k
     
-    def sigma(self, t: float, T: float) -> float:
+    def sigma(self, t: float | np.ndarray, T: float | np.ndarray) -> float | np.ndarray:
         """
         Compute the volatility σ at time t for maturity T.
 
-        :param float t: Current time.
-        :param float T: Maturity time.
-        :returns: Volatility at horizon (T - t).
-        :rtype: float
+        Accepts scalars or arrays; t and T are broadcast against each other.
+
+        :param float | np.ndarray t: Current time(s).
+        :param float | np.ndarray T: Maturity time(s).
+        :returns: Volatility at horizon (T - t), same shape as the broadcast inputs.
+        :rtype: float | np.ndarray
         """
-        tau = T - t
+        if isinstance(t, (int, float)) and isinstance(T, (int, float)):
+            # Chemin scalaire : math.exp évite le coût de dispatch des ufuncs NumPy
+            return self.gamma * math.exp(-self.k * (T - t))
+        tau = np.asarray(T) - np.asarray(t)
         return self.gamma * np.exp(-self.k * tau)
+
+    def variance(self, t: float | np.ndarray, T: float | np.ndarray) -> float | np.ndarray:
+        """
+        Compute the instantaneous variance σ(t, T)² = gamma² * exp(-2k * (T - t)).
+
+        :param float | np.ndarray t: Current time(s).
+        :param float | np.ndarray T: Maturity time(s).
+        :returns: Variance at horizon (T - t), same shape as the broadcast inputs.
+        :rtype: float | np.ndarray
+        """
+        if isinstance(t, (int, float)) and isinstance(T, (int, float)):
+            return self.gamma**2 * math.exp(-2 * self.k * (T - t))
+        tau = np.asarray(T) - np.asarray(t)
+        return self.gamma**2 * np.exp(-2 * self.k * tau)
     
     def calibrate(self, time_to_maturities: np.ndarray, vols: np.ndarray):
         """
@@ -1,5 +1,6 @@
 from hjmpy.volatilityModel.volatilityModel import VolatilityModel
 
+import math
 import numpy as np
 from sklearn.decomposition import PCA
 
@@ -16,7 +17,9 @@ class MultiFactorVolatilityModel(VolatilityModel):
         :param int n_factors: Number of principal components (factors) to keep.
         """
         self.n_factors = n_factors
-        self.pca = PCA(n_components=n_factors)
+        # Solveur randomisé : seules les n_factors premières composantes sont calculées
+        self.pca = PCA(n_components=n_factors, svd_solver='randomized',
+                       random_state=0, n_oversamples=5)
         self.components_ = None  # composants propres (n_factors x N)
         self.explained_variance_ = None
     
@@ -36,19 +39,37 @@ class MultiFactorVolatilityModel(VolatilityModel):
         self.explained_variance_ = self.pca.explained_variance_ratio_
         # Les composantes principales vont servir à construire les facteurs de volatilité.
 
-    def sigma(self, t: float, T: float):
+    def sigma(self, t: float | np.ndarray, T: float | np.ndarray):
         """
         Example method returning a volatility vector σ(t, T) of dimension n_factors
         depending on the time horizon (T - t).
 
         For simplicity, returns a vector with exponentially decaying components.
+        Accepts scalars or arrays; for array inputs the factor axis comes first.
 
-        :param float t: Current time.
-        :param float T: Maturity time.
-        :returns: Volatility vector at horizon (T - t).
+        :param float | np.ndarray t: Current time(s).
+        :param float | np.ndarray T: Maturity time(s).
+        :returns: Read-only volatility array of shape (n_factors,) + shape of (T - t).
         :rtype: np.ndarray
         """
         # Ici, on illustre: vol = exp(-k*(T-t)) pour chaque composante
-        tau = T - t
+        tau = np.asarray(T) - np.asarray(t)
         # On peut calibrer k séparément ou utiliser composantes
-        return np.array([np.exp(-0.5 * tau)] * self.n_factors)
\ No newline at end of file
+        return np.broadcast_to(np.exp(-0.5 * tau), (self.n_factors,) + np.shape(tau))
+
+    def variance(self, t: float | np.ndarray, T: float | np.ndarray):
+        """
+        Total variance Σ_i σ_i(t, T)² summed over the factors.
+
+        All components of sigma are identical, so the sum reduces to the
+        closed form n_factors * exp(-(T - t)).
+
+        :param float | np.ndarray t: Current time(s).
+        :param float | np.ndarray T: Maturity time(s).
+        :returns: Total variance at horizon (T - t), same shape as the broadcast inputs.
+        :rtype: float | np.ndarray
+        """
+        if isinstance(t, (int, float)) and isinstance(T, (int, float)):
+            return self.n_factors * math.exp(-(T - t))
+        tau = np.asarray(T) - np.asarray(t)
+        return self.n_factors * np.exp(-tau)
\ No newline at end of file
@@ -1,20 +1,43 @@
+import numpy as np
+
+
 class VolatilityModel:
     """
     Abstract class for volatility models.
     """
 
-    def sigma(self, t: float, T: float) -> float:
+    def sigma(self, t, T):
         """
         Instantaneous volatility σ(t, T) at current time t and maturity T.
 
-        :param float t: Current time.
-        :param float T: Maturity time.
+        Implementations should accept scalars as well as arrays of times.
+
+        :param float | np.ndarray t: Current time(s).
+        :param float | np.ndarray T: Maturity time(s).
         :returns: Instantaneous volatility.
-        :rtype: float
+        :rtype: float | np.ndarray
         :raises NotImplementedError: Must be implemented by subclasses.
         """
         raise NotImplementedError
 
+    def variance(self, t, T):
+        """
+        Total instantaneous variance Σ_i σ_i(t, T)² summed over the factors.
+
+        Generic implementation based on sigma; subclasses should override it
+        with a closed form when one is available.
+
+        :param float | np.ndarray t: Current time(s).
+        :param float | np.ndarray T: Maturity time(s).
+        :returns: Instantaneous variance, same shape as the broadcast inputs.
+        :rtype: float | np.ndarray
+        """
+        sigma = self.sigma(t, T)
+        if isinstance(sigma, np.ndarray) and sigma.ndim > np.ndim(np.asarray(T) - np.asarray(t)):
+            # Multi-facteurs : axe des facteurs en tête
+            return np.sum(sigma**2, axis=0)
+        return sigma**2
+
     def calibrate(self, *args, **kwargs):
         """
         Calibrate the model on historical data (e.g., via PCA).